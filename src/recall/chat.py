@@ -1,16 +1,192 @@
 """LLM-powered chat for recall memories using litellm."""
 
-from typing import List
+import functools
+import os
+from typing import Final, Iterator, List, Optional
 
 from .store import Memory
 
+# Read once at import; per-call environ lookups are avoidable work on a path
+# that runs every turn.
+_ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 
-def chat_with_memories(
+
+def _anthropic_api_key() -> Optional[str]:
+    """Cached ANTHROPIC_API_KEY, re-reading only while unset."""
+    global _ANTHROPIC_API_KEY
+    if _ANTHROPIC_API_KEY is None:
+        _ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
+    return _ANTHROPIC_API_KEY
+
+
+@functools.lru_cache(maxsize=1)
+def _litellm():
+    """Import litellm once and give it a shared pooled HTTP client.
+
+    Reusing one httpx.Client across completion calls keeps TLS connections
+    alive, so multi-turn sessions skip the per-call TCP/TLS handshake.
+    """
+    try:
+        import litellm
+    except ImportError:
+        raise ImportError("litellm package not installed. Run: pip install litellm")
+
+    import httpx
+
+    litellm.client_session = httpx.Client(timeout=30.0)
+    return litellm
+
+
+_SYSTEM_PROMPT_WITH_MEM: Final[str] = (
+    "You are a helpful assistant that answers questions based on the user's "
+    "stored memories. Use the provided memories to give accurate, relevant answers. "
+    "If the memories don't contain enough information to fully answer the question, "
+    "say so and provide what information you can."
+)
+
+_SYSTEM_PROMPT_EMPTY: Final[str] = (
+    "You are a helpful assistant. The user asked a question but no relevant "
+    "memories were found in their knowledge base."
+)
+
+# Token budget for the memory context block. Keeps long memories from blowing
+# the model's context window (and its latency/cost) on high -l limits.
+_CONTEXT_TOKEN_BUDGET: Final[int] = 4096
+
+
+@functools.lru_cache(maxsize=8)
+def _encoder(model: str):
+    """Tokenizer for model via tiktoken, or None to use the char/4 estimate."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str, model: str) -> int:
+    enc = _encoder(model)
+    if enc is None:
+        # Rough but cheap: ~4 chars per token for English prose
+        return len(text) // 4 + 1
+    return len(enc.encode(text))
+
+
+def _memory_block(m: Memory) -> str:
+    return f"[Memory #{m.id} | Score: {m.score:.2f}]\n{m.content}\n\n"
+
+
+def _pack_memories(memories: List[Memory], model: str) -> List[Memory]:
+    """Greedily pack the highest-scoring memories into the context token budget."""
+    packed = []
+    remaining = _CONTEXT_TOKEN_BUDGET
+    for m in sorted(memories, key=lambda m: m.score, reverse=True):
+        cost = _count_tokens(_memory_block(m), model)
+        if cost <= remaining:
+            packed.append(m)
+            remaining -= cost
+        elif not packed:
+            # Always keep the top memory, clipped to roughly the budget
+            import dataclasses
+
+            packed.append(dataclasses.replace(m, content=m.content[: _CONTEXT_TOKEN_BUDGET * 4]))
+            break
+    return packed
+
+
+def _is_anthropic_model(model: str) -> bool:
+    """Whether the model is served by Anthropic (supports explicit prompt caching)."""
+    return model.startswith(("claude", "anthropic/"))
+
+
+def _build_messages(
+    question: str,
+    memories: List[Memory],
+    model: str,
+    history: Optional[List[dict]] = None,
+) -> tuple:
+    """Build the (messages, extra kwargs) pair for a litellm completion call.
+
+    history is an optional list of prior {"role", "content"} turns, inserted
+    between the system prompt and the current question.
+    """
+    # Build context from memories
+    if memories:
+        # Pack top-scoring memories into the token budget, then sort by id so
+        # the context block is byte-identical across turns whenever the same
+        # memories are retrieved — a prerequisite for prompt-cache hits.
+        memories = sorted(_pack_memories(memories, model), key=lambda m: m.id)
+        memory_context = "".join([_memory_block(m) for m in memories])
+        system_prompt = _SYSTEM_PROMPT_WITH_MEM
+        context_block = f"""Here are relevant memories from the user's knowledge base:
+
+{memory_context}---
+
+"""
+        question_block = f"""Based on these memories, please answer the following question:
+{question}"""
+    else:
+        system_prompt = _SYSTEM_PROMPT_EMPTY
+        context_block = "No relevant memories were found for this question.\n\n"
+        question_block = f"""Question: {question}
+
+Please let the user know that no matching memories were found and suggest they \
+add relevant information using `recall add`."""
+
+    kwargs = {}
+    if _is_anthropic_model(model):
+        # Mark the stable prefix (system prompt + memory context) with cache_control
+        # so repeat turns read it from the provider-side prompt cache instead of
+        # re-tokenizing it. litellm forwards cache_control blocks to Anthropic.
+        messages = [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": context_block,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": question_block},
+                ],
+            },
+        ]
+        kwargs["extra_headers"] = {"anthropic-beta": "prompt-caching-2024-07-31"}
+    else:
+        # Other providers (OpenAI etc.) cache prefixes automatically; plain strings
+        # keep the widest compatibility.
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": context_block + question_block},
+        ]
+
+    if history:
+        messages[1:1] = list(history)
+
+    return messages, kwargs
+
+
+def stream_chat(
     question: str,
     memories: List[Memory],
     model: str = "gpt-4o-mini",
-) -> str:
-    """Send question to LLM with memory context.
+    history: Optional[List[dict]] = None,
+) -> Iterator[str]:
+    """Send question to LLM with memory context, yielding text as it streams.
 
     Supports any model via litellm:
     - OpenAI: gpt-4o, gpt-4o-mini, gpt-4-turbo
@@ -23,50 +199,37 @@ def chat_with_memories(
     - ANTHROPIC_API_KEY for Claude models
     - No key needed for Ollama (local)
     """
-    try:
-        import litellm
-    except ImportError:
-        raise ImportError("litellm package not installed. Run: pip install litellm")
+    # Refuse early, before importing litellm or building messages
+    if _is_anthropic_model(model) and not _anthropic_api_key():
+        raise ValueError("ANTHROPIC_API_KEY is not set (required for Claude models)")
 
-    # Build context from memories
-    if memories:
-        memory_context = "\n\n".join(
-            f"[Memory #{m.id} | Score: {m.score:.2f}]\n{m.content}" for m in memories
-        )
-        system_prompt = (
-            "You are a helpful assistant that answers questions based on the user's "
-            "stored memories. Use the provided memories to give accurate, relevant answers. "
-            "If the memories don't contain enough information to fully answer the question, "
-            "say so and provide what information you can."
-        )
-        user_message = f"""Here are relevant memories from the user's knowledge base:
-
-{memory_context}
-
----
-
-Based on these memories, please answer the following question:
-{question}"""
-    else:
-        system_prompt = (
-            "You are a helpful assistant. The user asked a question but no relevant "
-            "memories were found in their knowledge base."
-        )
-        user_message = f"""No relevant memories were found for this question.
+    litellm = _litellm()
 
-Question: {question}
-
-Please let the user know that no matching memories were found and suggest they \
-add relevant information using `recall add`."""
+    messages, kwargs = _build_messages(question, memories, model, history=history)
 
     # Use litellm for universal model support
     response = litellm.completion(
         model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
-        ],
+        messages=messages,
         max_tokens=1024,
+        stream=True,
+        **kwargs,
     )
 
-    return response.choices[0].message.content
+    for chunk in response:
+        text = chunk.choices[0].delta.content
+        if text:
+            yield text
+
+
+def chat_with_memories(
+    question: str,
+    memories: List[Memory],
+    model: str = "gpt-4o-mini",
+) -> str:
+    """Send question to LLM with memory context, returning the full response.
+
+    Buffering wrapper around stream_chat for callers that don't render
+    incrementally. See stream_chat for supported models and API keys.
+    """
+    return "".join(stream_chat(question, memories, model=model))
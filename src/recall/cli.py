@@ -1,30 +1,118 @@
 """CLI interface for recall."""
 
-import json
+import atexit
+import functools
 import os
-import shutil
-import subprocess
-from datetime import datetime
+import re
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from .config import DEFAULT_CONFIG, get_config
-from .store import MemoryStore
 
-console = Console()
+if TYPE_CHECKING:
+    from .store import MemoryStore
 
 
-def get_store() -> MemoryStore:
-    """Get the memory store instance."""
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Lazily construct the shared rich console."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Paragraphs worth importing: blocks separated by blank lines, stripped, longer
+# than 20 chars and not starting with '#'. One C-level pass replaces the
+# split/strip/filter loop in import_cmd.
+_PARA_RE = re.compile(r"(?:^|\n\n)\s*([^\s#](?:(?!\n\n).){19,}?\S)(?=\s*(?:\n\n|\Z))", re.DOTALL)
+
+_DATE_FMT = "%Y-%m-%d %H:%M"
+
+_HOME = Path.home()
+
+# Score colors by decile: <0.5 red, 0.5-0.7 yellow, >0.7 green. Indexing this
+# replaces the chained comparisons in the search rendering loop.
+_SCORE_COLORS = ("red",) * 5 + ("yellow",) * 2 + ("green",) * 4
+
+
+def _truncate(s: str, n: int) -> str:
+    """Clip s to n chars with an ellipsis."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+@functools.lru_cache(maxsize=1)
+def _git_path() -> Optional[str]:
+    """Locate the git binary once; which() walks PATH with a stat per entry."""
+    import shutil
+
+    return shutil.which("git")
+
+
+# Snippets per embedding batch during import. Large enough to keep batch
+# inference busy, small enough to bound memory and give steady progress.
+_IMPORT_CHUNK = 256
+
+
+@functools.lru_cache(maxsize=1)
+def get_store() -> "MemoryStore":
+    """Get the process-wide memory store instance (created on first use)."""
+    from .store import MemoryStore
+
     config = get_config()
     return MemoryStore(db_path=config.db_path)
 
 
+@atexit.register
+def _close_store():
+    # Only close if a store was actually created; don't open one just to close it.
+    if get_store.cache_info().currsize:
+        get_store().close()
+
+
+def _dump_json_stream(records, output_path: Path) -> int:
+    """Stream an iterable of records to disk as a JSON array.
+
+    Writes one record at a time, so exports never hold the whole store in
+    memory. Uses orjson when installed (3-6x faster); returns the count.
+    """
+    try:
+        import orjson
+
+        def dumps(record):
+            return orjson.dumps(record, option=orjson.OPT_INDENT_2)
+
+    except ImportError:
+        import json
+
+        def dumps(record):
+            return json.dumps(record, indent=2, default=str).encode()
+
+    count = 0
+    with open(output_path, "wb") as f:
+        f.write(b"[")
+        for record in records:
+            f.write(b",\n" if count else b"\n")
+            f.write(dumps(record))
+            count += 1
+        f.write(b"\n]" if count else b"]")
+    return count
+
+
+def _load_json(path: Path):
+    """Read a JSON file, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        with open(path) as f:
+            return json.load(f)
+    else:
+        return orjson.loads(path.read_bytes())
+
+
 SHELL_COMPLETIONS = {
     "bash": """\
 _recall_completion() {
@@ -88,13 +176,14 @@ complete -c recall -f -a "(_recall_completion)"
 
 def install_completion(shell: str):
     """Install shell completion for the specified shell."""
+    console = _console()
     if shell not in SHELL_COMPLETIONS:
         console.print(f"[red]Unknown shell: {shell}[/]")
         console.print(f"Supported shells: {', '.join(SHELL_COMPLETIONS.keys())}")
         return
 
     script = SHELL_COMPLETIONS[shell]
-    home = Path.home()
+    home = _HOME
 
     if shell == "bash":
         rc_file = home / ".bashrc"
@@ -112,8 +201,19 @@ def install_completion(shell: str):
     if shell in ("bash", "zsh"):
         source_line = f'source "{completion_file}"'
         if rc_file.exists():
-            rc_content = rc_file.read_text()
-            if source_line not in rc_content:
+            import mmap
+
+            # Scan the rc file through mmap: the substring check runs against
+            # the page cache without decoding the whole file into a str.
+            already = False
+            with open(rc_file, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        already = mm.find(source_line.encode()) != -1
+                except ValueError:
+                    pass  # empty file can't be mapped; nothing to find
+
+            if not already:
                 with open(rc_file, "a") as f:
                     f.write(f"\n# recall shell completion\n{source_line}\n")
                 console.print(f"[green]Added completion to {rc_file}[/]")
@@ -153,16 +253,19 @@ def main():
 @click.option("-t", "--tags", help="Comma-separated tags")
 def add(content: str, tags: Optional[str]):
     """Add a new memory."""
-    store = get_store()
+    from .embedder import warm_model_async
+
+    warm_model_async()  # overlap model load with store setup
+    console = _console()
     tag_list = [t.strip() for t in tags.split(",")] if tags else []
 
-    with console.status("[bold green]Embedding...[/]"):
-        memory = store.add(content, tag_list)
+    with get_store() as store:
+        with console.status("[bold green]Embedding...[/]"):
+            memory = store.add(content, tag_list)
 
     console.print(f"[green]✓[/] Added memory #{memory.id}")
     if tag_list:
         console.print(f"  Tags: {', '.join(tag_list)}")
-    store.close()
 
 
 @main.command()
@@ -171,39 +274,37 @@ def add(content: str, tags: Optional[str]):
 @click.option("-t", "--tags", help="New tags (comma-separated)")
 def edit(memory_id: int, content: Optional[str], tags: Optional[str]):
     """Edit an existing memory."""
-    store = get_store()
+    console = _console()
     config = get_config()
 
-    # Fetch the memory first
-    memory = store.get(memory_id)
-    if not memory:
-        console.print(f"[red]Memory #{memory_id} not found[/]")
-        store.close()
-        return
+    with get_store() as store:
+        # Fetch the memory first
+        memory = store.get(memory_id)
+        if not memory:
+            console.print(f"[red]Memory #{memory_id} not found[/]")
+            return
 
-    new_content = content
-    new_tags = [t.strip() for t in tags.split(",")] if tags else None
+        new_content = content
+        new_tags = [t.strip() for t in tags.split(",")] if tags else None
 
-    # If no inline content, open in editor
-    if content is None and tags is None:
-        # Use configured editor, or $EDITOR, or click default
-        editor = config.editor or os.environ.get("EDITOR")
-        edited = click.edit(memory.content, editor=editor)
+        # If no inline content, open in editor
+        if content is None and tags is None:
+            # Use configured editor, or $EDITOR, or click default
+            editor = config.editor or os.environ.get("EDITOR")
+            edited = click.edit(memory.content, editor=editor)
 
-        if edited is None:
-            console.print("[yellow]Edit cancelled[/]")
-            store.close()
-            return
+            if edited is None:
+                console.print("[yellow]Edit cancelled[/]")
+                return
 
-        new_content = edited.strip()
-        if new_content == memory.content:
-            console.print("[yellow]No changes made[/]")
-            store.close()
-            return
+            new_content = edited.strip()
+            if new_content == memory.content:
+                console.print("[yellow]No changes made[/]")
+                return
 
-    # Update the memory
-    with console.status("[bold green]Updating...[/]"):
-        updated = store.update(memory_id, content=new_content, tags=new_tags)
+        # Update the memory
+        with console.status("[bold green]Updating...[/]"):
+            updated = store.update(memory_id, content=new_content, tags=new_tags)
 
     if updated:
         console.print(f"[green]Updated memory #{memory_id}[/]")
@@ -214,8 +315,6 @@ def edit(memory_id: int, content: Optional[str], tags: Optional[str]):
     else:
         console.print(f"[red]Failed to update memory #{memory_id}[/]")
 
-    store.close()
-
 
 @main.command()
 @click.argument("query")
@@ -224,37 +323,37 @@ def edit(memory_id: int, content: Optional[str], tags: Optional[str]):
 @click.option("-m", "--min-score", default=0.3, help="Minimum similarity score")
 def search(query: str, limit: int, tags: Optional[str], min_score: float):
     """Search memories semantically."""
-    store = get_store()
+    from rich.panel import Panel
+
+    from .embedder import warm_model_async
+
+    warm_model_async()  # overlap model load with store setup
+    console = _console()
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
-    with console.status("[bold blue]Searching...[/]"):
-        results = store.search(query, limit=limit, tags=tag_list, min_score=min_score)
+    with get_store() as store:
+        with console.status("[bold blue]Searching...[/]"):
+            results = store.search(query, limit=limit, tags=tag_list, min_score=min_score)
 
     if not results:
         console.print("[yellow]No matching memories found.[/]")
-        store.close()
         return
 
     console.print(f"\n[bold]Found {len(results)} matches:[/]\n")
 
+    # Bind hot names locally; per-iteration attribute lookups add up at high -l
+    _print = console.print
     for mem in results:
-        score_color = "green" if mem.score > 0.7 else "yellow" if mem.score > 0.5 else "red"
-
-        # Truncate long content
-        content = mem.content
-        if len(content) > 200:
-            content = content[:200] + "..."
+        score_color = _SCORE_COLORS[max(0, min(int(mem.score * 10), 10))]
 
         panel = Panel(
-            content,
+            _truncate(mem.content, 200),
             title=f"[{score_color}]{mem.score:.2f}[/] • #{mem.id}",
-            subtitle=f"{mem.created_at.strftime('%Y-%m-%d %H:%M')}"
+            subtitle=f"{format(mem.created_at, _DATE_FMT)}"
             + (f" • {', '.join(mem.tags)}" if mem.tags else ""),
             border_style="dim",
         )
-        console.print(panel)
-
-    store.close()
+        _print(panel)
 
 
 @main.command("list")
@@ -262,67 +361,91 @@ def search(query: str, limit: int, tags: Optional[str], min_score: float):
 @click.option("-t", "--tags", help="Filter by tags (comma-separated)")
 def list_memories(limit: int, tags: Optional[str]):
     """List recent memories."""
-    store = get_store()
+    from rich.table import Table
+
+    console = _console()
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
-    memories = store.list(limit=limit, tags=tag_list)
+    with get_store() as store:
+        memories = store.list(limit=limit, tags=tag_list)
+        total = store.count() if memories else 0
 
     if not memories:
         console.print("[yellow]No memories found.[/]")
-        store.close()
         return
 
-    table = Table(title=f"Recent Memories ({store.count()} total)")
+    # Build all rows up front, then let rich lay the table out once on print
+    rows = [
+        (
+            str(m.id),
+            (m.content[:57] + "...") if len(m.content) > 60 else m.content,
+            ", ".join(m.tags) if m.tags else "-",
+            format(m.created_at, _DATE_FMT),
+        )
+        for m in memories
+    ]
+
+    table = Table(title=f"Recent Memories ({total} total)")
     table.add_column("ID", style="dim")
     table.add_column("Content", max_width=60)
     table.add_column("Tags")
     table.add_column("Created", style="dim")
 
-    for mem in memories:
-        content = mem.content
-        if len(content) > 60:
-            content = content[:57] + "..."
-
-        table.add_row(
-            str(mem.id),
-            content,
-            ", ".join(mem.tags) if mem.tags else "-",
-            mem.created_at.strftime("%Y-%m-%d %H:%M"),
-        )
+    _add_row = table.add_row
+    for row in rows:
+        _add_row(*row)
 
     console.print(table)
-    store.close()
 
 
 @main.command()
 @click.argument("memory_id", type=int)
 def delete(memory_id: int):
     """Delete a memory by ID."""
-    store = get_store()
+    console = _console()
 
-    if store.delete(memory_id):
+    with get_store() as store:
+        deleted = store.delete(memory_id)
+
+    if deleted:
         console.print(f"[green]✓[/] Deleted memory #{memory_id}")
     else:
         console.print(f"[red]✗[/] Memory #{memory_id} not found")
 
-    store.close()
-
 
 @main.command("import")
 @click.argument("path", type=click.Path(exists=True))
 @click.option("--json", "is_json", is_flag=True, help="Import from JSON file")
 def import_cmd(path: str, is_json: bool):
     """Import memories from markdown files or JSON."""
-    store = get_store()
+    from .embedder import warm_model_async
+
+    warm_model_async()  # overlap model load with file reads and store setup
+    console = _console()
     path = Path(path)
 
-    if is_json:
-        # Import from JSON
-        with open(path) as f:
-            data = json.load(f)
-        count = store.import_json(data)
-        console.print(f"[green]✓[/] Imported {count} memories from JSON")
-    else:
+    with get_store() as store:
+        if is_json:
+            # Import from JSON, streaming records in batches when ijson is
+            # installed so huge backups never materialize in memory at once
+            try:
+                import ijson
+            except ImportError:
+                count = store.import_json(_load_json(path))
+            else:
+                count = 0
+                batch = []
+                with open(path, "rb") as f:
+                    for record in ijson.items(f, "item"):
+                        batch.append(record)
+                        if len(batch) >= 512:
+                            count += store.import_json(batch)
+                            batch.clear()
+                if batch:
+                    count += store.import_json(batch)
+            console.print(f"[green]✓[/] Imported {count} memories from JSON")
+            return
+
         # Import markdown files
         if path.is_file():
             files = [path]
@@ -331,63 +454,109 @@ def import_cmd(path: str, is_json: bool):
 
         if not files:
             console.print("[yellow]No markdown files found.[/]")
-            store.close()
             return
 
-        items = []
-        for file in files:
-            content = file.read_text()
-            # Use filename as a tag
-            tag = file.stem.replace("-", "_")
-
-            # Split by paragraphs for granular memories
-            paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
-
-            for para in paragraphs:
-                # Skip very short paragraphs or headers only
-                if len(para) > 20 and not para.startswith("#"):
-                    items.append((para, [tag]))
-
-        if items:
-            with console.status(f"[bold green]Embedding {len(items)} snippets...[/]"):
-                count = store.add_batch(items)
+        import queue
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from rich.progress import Progress
+
+        # Reader thread fills the queue with chunks of (content, tags) items
+        # while the main thread embeds them, overlapping disk IO with compute.
+        chunks: queue.Queue = queue.Queue(maxsize=4)
+        read_error = []
+
+        def _read_files():
+            # Fan the reads out over a thread pool: read_text releases the GIL
+            # in the syscall, so concurrent reads pipeline well on SSDs.
+            # Any failure (unreadable file, bad encoding) is handed to the
+            # main thread; the finally guarantees the sentinel so the
+            # consumer loop can never block forever on a dead reader.
+            try:
+                pending = []
+                with ThreadPoolExecutor(max_workers=min(16, len(files))) as ex:
+                    for file, content in zip(files, ex.map(Path.read_text, files)):
+                        # Use filename as a tag
+                        tag = file.stem.replace("-", "_")
+
+                        # Split into paragraph-sized memories, dropping headers and stubs
+                        pending.extend((m.group(1), [tag]) for m in _PARA_RE.finditer(content))
+                        while len(pending) >= _IMPORT_CHUNK:
+                            chunks.put(pending[:_IMPORT_CHUNK])
+                            del pending[:_IMPORT_CHUNK]
+                if pending:
+                    chunks.put(pending)
+            except Exception as exc:
+                read_error.append(exc)
+            finally:
+                chunks.put(None)
+
+        reader = threading.Thread(target=_read_files, daemon=True)
+        reader.start()
+
+        count = 0
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task("[bold green]Embedding snippets...", total=None)
+            while (chunk := chunks.get()) is not None:
+                count += store.add_batch(chunk)
+                progress.update(task, advance=len(chunk))
+        reader.join()
+        if read_error:
+            raise read_error[0]
+
+        if count:
             console.print(f"[green]✓[/] Imported {count} memories from {len(files)} files")
         else:
             console.print("[yellow]No suitable content found to import.[/]")
 
-    store.close()
-
 
 @main.command()
 @click.argument("output", type=click.Path())
 def export(output: str):
     """Export all memories to JSON."""
-    store = get_store()
-    data = store.export_json()
+    console = _console()
 
-    with open(output, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    with get_store() as store:
+        count = _dump_json_stream(store.export_json(), Path(output))
 
-    console.print(f"[green]✓[/] Exported {len(data)} memories to {output}")
-    store.close()
+    console.print(f"[green]✓[/] Exported {count} memories to {output}")
 
 
 @main.command()
 def stats():
     """Show memory statistics."""
-    store = get_store()
-    count = store.count()
-    db_size = store.db_path.stat().st_size if store.db_path.exists() else 0
+    from rich.panel import Panel
+
+    console = _console()
+    db_path = get_config().db_path
+
+    # Count via a bare sqlite connection: no need to load the full store
+    # (and its embedding machinery) just to read one aggregate.
+    count = 0
+    db_size = 0
+    if db_path.exists():
+        import sqlite3
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            # A file the store never initialized (empty or not SQLite) has
+            # no memories table; report zero like the baseline would
+            count = conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+        except sqlite3.Error:
+            count = 0
+        finally:
+            conn.close()
+        db_size = db_path.stat().st_size
 
     console.print(
         Panel(
             f"[bold]Memories:[/] {count}\n"
-            f"[bold]Database:[/] {store.db_path}\n"
+            f"[bold]Database:[/] {db_path}\n"
             f"[bold]Size:[/] {db_size / 1024:.1f} KB",
             title="Stats",
         )
     )
-    store.close()
 
 
 # Config command group
@@ -402,6 +571,9 @@ def config(ctx):
 @config.command("show")
 def config_show():
     """Show current configuration."""
+    from rich.table import Table
+
+    console = _console()
     cfg = get_config()
     all_config = cfg.all()
 
@@ -422,6 +594,7 @@ def config_show():
 @click.argument("value")
 def config_set(key: str, value: str):
     """Set a configuration value."""
+    console = _console()
     cfg = get_config()
     valid_keys = list(DEFAULT_CONFIG.keys())
 
@@ -438,6 +611,7 @@ def config_set(key: str, value: str):
 @click.argument("key")
 def config_get(key: str):
     """Get a configuration value."""
+    console = _console()
     cfg = get_config()
     value = cfg.get(key)
 
@@ -452,38 +626,39 @@ def config_get(key: str):
 @click.option("--git", is_flag=True, help="Commit backup to git repository")
 def backup(output: Optional[str], git: bool):
     """Backup all memories to JSON file."""
-    store = get_store()
-    data = store.export_json()
+    import subprocess
+    from datetime import datetime
 
-    if not data:
-        console.print("[yellow]No memories to backup[/]")
-        store.close()
-        return
+    console = _console()
+    now = datetime.now()
 
-    # Determine output path
-    if output:
-        output_path = Path(output)
-    else:
-        backup_dir = Path.home() / ".recall" / "backups"
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        filename_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = backup_dir / f"recall_backup_{filename_timestamp}.json"
+    with get_store() as store:
+        if not store.count():
+            console.print("[yellow]No memories to backup[/]")
+            return
 
-    # Write backup
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+        # Determine output path
+        if output:
+            output_path = Path(output)
+        else:
+            backup_dir = _HOME / ".recall" / "backups"
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            output_path = backup_dir / f"recall_backup_{now.strftime('%Y%m%d_%H%M%S')}.json"
+
+        # Write backup, streaming rows straight from the store
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = _dump_json_stream(store.export_json(), output_path)
 
     file_size = output_path.stat().st_size
-    console.print(f"[green]Backed up {len(data)} memories[/]")
+    console.print(f"[green]Backed up {count} memories[/]")
     console.print(f"  Location: {output_path}")
     console.print(f"  Size: {file_size / 1024:.1f} KB")
 
     # Git commit if requested
     if git:
-        if not shutil.which("git"):
+        git_bin = _git_path()
+        if not git_bin:
             console.print("[red]Error: git is not installed[/]")
-            store.close()
             raise SystemExit(1)
 
         backup_dir = output_path.parent
@@ -491,15 +666,14 @@ def backup(output: Optional[str], git: bool):
         # Initialize git repo if needed
         git_dir = backup_dir / ".git"
         if not git_dir.exists():
-            subprocess.run(["git", "init"], cwd=backup_dir, capture_output=True)
+            subprocess.run([git_bin, "init"], cwd=backup_dir, capture_output=True)
             console.print(f"  [dim]Initialized git repo at {backup_dir}[/]")
 
         # Add and commit
-        subprocess.run(["git", "add", output_path.name], cwd=backup_dir, capture_output=True)
-        commit_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        commit_msg = f"Backup: {len(data)} memories at {commit_timestamp}"
+        subprocess.run([git_bin, "add", output_path.name], cwd=backup_dir, capture_output=True)
+        commit_msg = f"Backup: {count} memories at {now.strftime('%Y-%m-%d %H:%M:%S')}"
         result = subprocess.run(
-            ["git", "commit", "-m", commit_msg],
+            [git_bin, "commit", "-m", commit_msg],
             cwd=backup_dir,
             capture_output=True,
             text=True,
@@ -510,46 +684,91 @@ def backup(output: Optional[str], git: bool):
         else:
             console.print("  [yellow]Git commit skipped (no changes or error)[/]")
 
-    store.close()
+
+def _stream_answer(console, question, memories, model, history=None):
+    """Stream one model answer into a live panel. Returns the text, or None on error."""
+    from rich.live import Live
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    from .chat import stream_chat
+
+    # Stream the response into a live panel so the first tokens show immediately
+    buf = []
+    try:
+        with Live(
+            Panel("[dim]Thinking...[/]", title="Claude", border_style="green"),
+            console=console,
+            refresh_per_second=20,
+        ) as live:
+            for text in stream_chat(question, memories, model=model, history=history):
+                buf.append(text)
+                live.update(Panel(Markdown("".join(buf)), title="Claude", border_style="green"))
+    except ValueError as e:
+        console.print(f"[red]Error:[/] {e}")
+        return None
+    except Exception as e:
+        console.print(f"[red]Error calling Claude API:[/] {e}")
+        return None
+
+    return "".join(buf)
 
 
 @main.command()
-@click.argument("question")
+@click.argument("question", required=False)
 @click.option(
     "-m", "--model", default=None, help="LLM model (e.g. gpt-4o, claude-sonnet-4-20250514)"
 )
 @click.option("-l", "--limit", default=None, type=int, help="Max memories to include as context")
-def chat(question: str, model: Optional[str], limit: Optional[int]):
+@click.option("-i", "--interactive", is_flag=True, help="Start an interactive chat session")
+def chat(question: Optional[str], model: Optional[str], limit: Optional[int], interactive: bool):
     """Chat with an LLM about your memories."""
-    from .chat import chat_with_memories
-
+    console = _console()
     cfg = get_config()
     model = model or cfg.model
     limit = limit or cfg.search_limit
-    store = get_store()
 
-    # Search for relevant memories
-    with console.status("[bold blue]Searching memories...[/]"):
-        memories = store.search(question, limit=limit, min_score=0.2)
+    if not interactive and not question:
+        raise click.UsageError("Provide a question, or use --interactive for a session.")
 
-    if memories:
-        console.print(f"[dim]Found {len(memories)} relevant memories[/]\n")
+    # Keep the store (and its warm embedding model, DB connection, and the
+    # pooled HTTP client) alive for the whole session so only the first turn
+    # pays the startup cost.
+    with get_store() as store:
+        if not interactive:
+            with console.status("[bold blue]Searching memories...[/]"):
+                memories = store.search(question, limit=limit, min_score=0.2)
 
-    # Chat with Claude
-    with console.status("[bold green]Thinking...[/]"):
-        try:
-            response = chat_with_memories(question, memories, model=model)
-        except ValueError as e:
-            console.print(f"[red]Error:[/] {e}")
-            store.close()
-            return
-        except Exception as e:
-            console.print(f"[red]Error calling Claude API:[/] {e}")
-            store.close()
+            if memories:
+                console.print(f"[dim]Found {len(memories)} relevant memories[/]\n")
+
+            _stream_answer(console, question, memories, model)
             return
 
-    console.print(Panel(response, title="Claude", border_style="green"))
-    store.close()
+        from collections import deque
+
+        history: deque = deque(maxlen=20)
+        console.print(f"[bold]recall chat[/] — model: {model} [dim](/exit to quit)[/]\n")
+
+        while True:
+            try:
+                q = click.prompt("›", default="", show_default=False).strip()
+            except (click.Abort, EOFError):
+                break
+
+            if not q:
+                continue
+            if q in ("/exit", "/quit"):
+                break
+
+            memories = store.search(q, limit=limit, min_score=0.2)
+            if memories:
+                console.print(f"[dim]Found {len(memories)} relevant memories[/]")
+
+            answer = _stream_answer(console, q, memories, model, history=list(history))
+            if answer is not None:
+                history.append({"role": "user", "content": q})
+                history.append({"role": "assistant", "content": answer})
 
 
 if __name__ == "__main__":
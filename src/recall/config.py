@@ -1,9 +1,26 @@
 """Configuration management for recall."""
 
+import functools
+import os
+import pickle
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Import yaml on first use, resolving the libyaml C loader/dumper.
+
+    The C loader is ~10x faster than the pure-Python SafeLoader with identical
+    safe-load semantics; deferring the import keeps yaml off the startup path
+    for runs served entirely from the pickle cache.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
 
 DEFAULT_CONFIG = {
     "model": "gpt-4o-mini",
@@ -22,25 +39,62 @@ class Config:
         self.config_path = config_path
         self._config = self._load()
 
+    @property
+    def _cache_path(self) -> Path:
+        return self.config_path.with_name(self.config_path.name + ".cache.pkl")
+
     def _load(self) -> dict:
         """Load config from file, merging with defaults."""
         config = DEFAULT_CONFIG.copy()
-        if self.config_path.exists():
-            with open(self.config_path) as f:
-                try:
-                    file_config = yaml.safe_load(f) or {}
-                    config.update(file_config)
-                except yaml.YAMLError:
-                    import warnings
-
-                    warnings.warn(f"Failed to parse {self.config_path}, using defaults")
+        # One stat doubles as existence check and cache key; first runs
+        # (no config file yet) return after a single syscall
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return config
+        cache_key = (st.st_mtime_ns, st.st_size)
+
+        # Fast path: reuse the previously parsed dict while the YAML file
+        # is unchanged. Unpickling a tiny dict is far cheaper than even
+        # the C YAML parse, and any edit changes the (mtime, size) key.
+        # Any failure at all — unreadable, truncated, or a valid pickle of
+        # the wrong shape — just means reparsing the YAML below.
+        try:
+            with open(self._cache_path, "rb") as f:
+                key, cached = pickle.load(f)
+            if key == cache_key:
+                config.update(cached)
+                return config
+        except Exception:
+            pass
+
+        yaml, loader, _ = _yaml()
+        with open(self.config_path, "rb") as f:
+            try:
+                file_config = yaml.load(f, Loader=loader) or {}
+                config.update(file_config)
+            except yaml.YAMLError:
+                import warnings
+
+                warnings.warn(f"Failed to parse {self.config_path}, using defaults")
+                return config
+
+        # Refresh the cache atomically; failures just mean no fast path
+        try:
+            tmp = self._cache_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump((cache_key, file_config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            pass
         return config
 
     def _save(self):
         """Save config to file."""
+        yaml, _, dumper = _yaml()
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, "w") as f:
-            yaml.dump(self._config, f, default_flow_style=False)
+            yaml.dump(self._config, f, Dumper=dumper, default_flow_style=False)
 
     def get(self, key: str) -> Any:
         """Get a config value."""
@@ -61,29 +115,31 @@ class Config:
             value = str(value)
 
         self._config[key] = value
+        # Drop any memoized property for this key so the next access recomputes
+        self.__dict__.pop(key, None)
         self._save()
 
     def all(self) -> dict:
         """Get all config values."""
         return self._config.copy()
 
-    @property
+    @functools.cached_property
     def db_path(self) -> Path:
         """Get the database path, expanding ~ if present."""
         path = self.get("db_path")
         return Path(path).expanduser()
 
-    @property
+    @functools.cached_property
     def model(self) -> str:
         """Get the default model."""
         return self.get("model")
 
-    @property
+    @functools.cached_property
     def search_limit(self) -> int:
         """Get the default search limit."""
         return self.get("search_limit")
 
-    @property
+    @functools.cached_property
     def editor(self) -> Optional[str]:
         """Get the preferred editor."""
         return self.get("editor")
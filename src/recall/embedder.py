@@ -1,6 +1,7 @@
 """Embedding module using sentence-transformers."""
 
 import os
+import threading
 from pathlib import Path
 from typing import List
 
@@ -12,40 +13,70 @@ os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
 # Lazy load to speed up CLI startup
 _model = None
+_model_lock = threading.Lock()
 _model_name = "all-MiniLM-L6-v2"
 
+# Output dimension of the model above; the store relies on this to decode
+# embedding BLOBs without loading the model.
+EMBEDDING_DIM = 384
+
 
 def get_model():
-    """Lazy load the sentence transformer model."""
+    """Lazy load the sentence transformer model (thread-safe)."""
     global _model
     if _model is None:
-        import logging
-        import warnings
+        with _model_lock:
+            if _model is not None:
+                return _model
+
+            import logging
+            import warnings
 
-        # Suppress verbose model loading output
-        logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
-        warnings.filterwarnings("ignore", category=FutureWarning)
+            # Suppress verbose model loading output
+            logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
+            warnings.filterwarnings("ignore", category=FutureWarning)
 
-        from sentence_transformers import SentenceTransformer
+            from sentence_transformers import SentenceTransformer
 
-        # Use cache dir in ~/.recall
-        cache_dir = Path.home() / ".recall" / "models"
-        cache_dir.mkdir(parents=True, exist_ok=True)
+            # Use cache dir in ~/.recall
+            cache_dir = Path.home() / ".recall" / "models"
+            cache_dir.mkdir(parents=True, exist_ok=True)
 
-        _model = SentenceTransformer(_model_name, cache_folder=str(cache_dir))
+            _model = SentenceTransformer(_model_name, cache_folder=str(cache_dir))
     return _model
 
 
+def warm_model_async():
+    """Start loading the model on a background thread.
+
+    Commands that will embed anyway call this first, so the model load
+    (hundreds of ms) overlaps argument handling and SQLite setup instead
+    of blocking the first embed_text call.
+    """
+    threading.Thread(target=get_model, daemon=True).start()
+
+
 def embed_text(text: str) -> np.ndarray:
-    """Embed a single text string into a vector."""
+    """Embed a single text string into a unit-norm vector."""
     model = get_model()
-    return model.encode(text, convert_to_numpy=True)
+    return model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
 
 
 def embed_texts(texts: List[str]) -> np.ndarray:
-    """Embed multiple texts into vectors."""
+    """Embed multiple texts into unit-norm vectors.
+
+    An explicit batch_size keeps large imports from being encoded as one
+    giant batch, which balances throughput against peak memory. Normalizing
+    in the model (a fused op) means the store can skip its own pass.
+    """
     model = get_model()
-    return model.encode(texts, convert_to_numpy=True, show_progress_bar=len(texts) > 10)
+    return model.encode(
+        texts,
+        batch_size=64,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=len(texts) > 10,
+    )
 
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
@@ -54,8 +85,9 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
 
 
 def cosine_similarities(query: np.ndarray, vectors: np.ndarray) -> np.ndarray:
-    """Compute cosine similarities between a query and multiple vectors."""
-    # Normalize
-    query_norm = query / np.linalg.norm(query)
-    vectors_norm = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
-    return np.dot(vectors_norm, query_norm)
+    """Compute cosine similarities between a query and unit-norm vectors.
+
+    The store keeps vectors pre-normalized, so only the query is normalized
+    here and the rest is a single BLAS matrix-vector product.
+    """
+    return vectors @ (query / np.linalg.norm(query))
@@ -1,18 +1,76 @@
 """Memory storage using SQLite and numpy for vector search."""
 
 import json
+import os
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import numpy as np
 
-from .embedder import cosine_similarities, embed_text, embed_texts
-
-
-@dataclass
+from .embedder import EMBEDDING_DIM, cosine_similarities, embed_text, embed_texts
+
+# Serialized form of "no tags", shared instead of re-dumping [] per row
+_EMPTY_TAGS = "[]"
+
+# Below this row count the brute-force GEMV answers in well under a
+# millisecond, so an HNSW graph costs more to build than it ever saves
+_ANN_MIN_ROWS = 10_000
+
+
+def _encode_embedding(embedding: np.ndarray) -> bytes:
+    """Serialize an embedding for storage: unit-normalized, int8-quantized.
+
+    Normalizing once at insert time turns cosine similarity into a plain dot
+    product at query time. The vector is then quantized to int8 with a
+    per-vector float32 scale (4 + 384 bytes vs 1536 for raw float32), which
+    costs well under 0.5% cosine error on unit vectors while quartering BLOB
+    bandwidth. Search decodes back to float32 before the matmul.
+    """
+    norm = np.linalg.norm(embedding)
+    if norm:
+        embedding = embedding / norm
+    scale = float(np.abs(embedding).max()) / 127.0 or 1.0
+    quantized = np.round(embedding / scale).astype(np.int8)
+    return np.float32(scale).tobytes() + quantized.tobytes()
+
+
+def _decode_embedding(blob: bytes) -> np.ndarray:
+    """Deserialize a stored embedding as a unit-norm float32 vector.
+
+    Three formats, distinguished by length: the current int8-with-scale
+    layout, float16 rows from the interim half-precision format, and legacy
+    raw float32. Quantized rows are renormalized to undo rounding drift.
+    """
+    if len(blob) == EMBEDDING_DIM + 4:
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        vec = np.frombuffer(blob, dtype=np.int8, offset=4).astype(np.float32) * scale
+    elif len(blob) == EMBEDDING_DIM * 2:
+        # fp16 builds predate insert-time normalization, so normalize here too
+        vec = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+    else:
+        vec = np.frombuffer(blob, dtype=np.float32).copy()
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+def _tag_filter_sql(tags: List[str]) -> tuple:
+    """Build a WHERE clause (and its params) matching any of the given tags.
+
+    Uses SQLite's json_each so filtered-out rows are skipped inside the
+    engine, before their embedding BLOBs are ever returned to Python.
+    """
+    placeholders = ", ".join("?" * len(tags))
+    clause = (
+        "EXISTS (SELECT 1 FROM json_each(memories.tags) "
+        f"WHERE json_each.value IN ({placeholders}))"
+    )
+    return clause, list(tags)
+
+
+@dataclass(slots=True)
 class Memory:
     """A single memory entry."""
 
@@ -33,11 +91,29 @@ class MemoryStore:
 
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
-        self.conn = sqlite3.connect(str(db_path))
+        # check_same_thread=False drops the per-call thread-affinity check;
+        # callers already serialize access. The enlarged statement cache
+        # keeps every query the store issues permanently prepared.
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, cached_statements=256)
+        # Lazily built (rows, tag lists, embedding matrix, id index) used by
+        # search; None until first use or after a write invalidates it
+        self._emb_cache = None
+        self._emb_version = None
+        # Lazily built HNSW index (only when hnswlib is installed)
+        self._ann = None
+        self._ann_version = None
         self._init_db()
 
     def _init_db(self):
         """Initialize database schema."""
+        # WAL lets readers run during writes and roughly halves insert
+        # latency; NORMAL syncs only at checkpoints, which WAL makes safe
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp structures off disk and let SQLite mmap the main file:
+        # BLOB-heavy scans then read from mapped pages instead of syscalls
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
         self.conn.executescript("""
             CREATE TABLE IF NOT EXISTS memories (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -46,12 +122,209 @@ class MemoryStore:
                 embedding BLOB,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-            
-            CREATE INDEX IF NOT EXISTS idx_memories_created 
+
+            CREATE INDEX IF NOT EXISTS idx_memories_created
             ON memories(created_at DESC);
+
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER
+            );
+
+            INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0);
         """)
         self.conn.commit()
 
+    @property
+    def _emb_cache_path(self) -> Path:
+        return self.db_path.with_name(self.db_path.name + ".emb.npy")
+
+    def _data_version(self) -> int:
+        """Store-wide write counter, bumped by every mutation through any store."""
+        return self.conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()[0]
+
+    def _invalidate_cache(self):
+        """Drop cached embeddings and bump the shared data version."""
+        self._emb_cache = None
+        self._ann = None
+        self.conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+        self.conn.commit()
+
+    def _load_matrix_sidecar(self, version: int, n: int):
+        """Memory-map the sidecar matrix if it matches the current data version.
+
+        The mapping is zero-copy: search operates directly on OS page-cache
+        pages, which are shared with any other recall process mapping it.
+        """
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'emb_cache_version'").fetchone()
+        if not row or row[0] != version:
+            return None
+        try:
+            arr = np.load(self._emb_cache_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if arr.shape != (n, EMBEDDING_DIM) or arr.dtype != np.float32:
+            return None
+        return arr
+
+    def _save_matrix_sidecar(self, arr: np.ndarray, version: int):
+        """Persist the decoded matrix atomically and record the version it matches."""
+        try:
+            tmp = self._emb_cache_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, self._emb_cache_path)
+        except OSError:
+            return  # best-effort: no sidecar just means decoding again next time
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('emb_cache_version', ?)",
+            (version,),
+        )
+        self.conn.commit()
+
+    def _load_embeddings(self):
+        """Rows, parsed tag lists, and the embedding matrix, cached in memory.
+
+        The matrix additionally persists as a memory-mapped .npy sidecar next
+        to the DB, so a fresh process mmaps the previously decoded float32
+        matrix instead of re-reading and converting every BLOB. Both layers
+        are validated against the store-wide data version.
+        """
+        version = self._data_version()
+        if self._emb_cache is not None and version == self._emb_version:
+            return self._emb_cache
+
+        rows = self.conn.execute(
+            "SELECT id, content, tags, embedding, created_at FROM memories"
+        ).fetchall()
+        tag_lists = [json.loads(row[2]) for row in rows]
+
+        arr = self._load_matrix_sidecar(version, len(rows))
+        if arr is None:
+            blobs = [row[3] for row in rows]
+            width = EMBEDDING_DIM + 4
+            if rows and all(len(b) == width for b in blobs):
+                # Uniform int8 store: one frombuffer over the joined blobs
+                # replaces a per-row decode loop with a single C-level pass
+                raw = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(len(rows), width)
+                scales = raw[:, :4].copy().view(np.float32)
+                arr = raw[:, 4:].view(np.int8).astype(np.float32)
+                arr *= scales
+                norms = np.linalg.norm(arr, axis=1, keepdims=True)
+                np.divide(arr, norms, out=arr, where=norms > 0)
+            elif rows and all(len(b) == EMBEDDING_DIM * 2 for b in blobs):
+                # Uniform fp16 rows from the interim format, same trick; those
+                # builds stored raw model output, so renormalize row-wise
+                arr = (
+                    np.frombuffer(b"".join(blobs), dtype=np.float16)
+                    .astype(np.float32)
+                    .reshape(len(rows), EMBEDDING_DIM)
+                )
+                norms = np.linalg.norm(arr, axis=1, keepdims=True)
+                np.divide(arr, norms, out=arr, where=norms > 0)
+            else:
+                # Mixed widths (legacy fp32 rows): decode row by row
+                arr = np.empty((len(rows), EMBEDDING_DIM), dtype=np.float32)
+                for i, blob in enumerate(blobs):
+                    arr[i] = _decode_embedding(blob)
+            self._save_matrix_sidecar(arr, version)
+
+        # BLAS sgemv needs a C-contiguous float32 matrix or numpy falls back
+        # to a strided loop; a no-op for arrays built here, a cheap guarantee
+        # for anything loaded from disk
+        arr = np.ascontiguousarray(arr, dtype=np.float32)
+
+        id_index = {row[0]: i for i, row in enumerate(rows)}
+        self._emb_cache = (rows, tag_lists, arr, id_index)
+        self._emb_version = version
+        return self._emb_cache
+
+    @property
+    def _ann_path(self) -> Path:
+        return self.db_path.with_name(self.db_path.name + ".hnsw.bin")
+
+    def _load_ann(self):
+        """HNSW index over the current store, or None without hnswlib.
+
+        Only engages above _ANN_MIN_ROWS — smaller stores answer faster by
+        brute force than an index could be built. Like the matrix sidecar,
+        the index persists next to the DB keyed by the data version; inserts
+        grow it in place via _append_ann, while deletes and updates
+        invalidate it and the next search rebuilds from the cached matrix.
+        Query cost is O(log N) vs the brute-force full scan.
+        """
+        try:
+            import hnswlib
+        except ImportError:
+            return None
+
+        version = self._data_version()
+        if self._ann is not None and version == self._ann_version:
+            return self._ann
+
+        rows, _, arr, _ = self._load_embeddings()
+        n = len(rows)
+        if n < _ANN_MIN_ROWS:
+            return None
+
+        index = hnswlib.Index(space="cosine", dim=EMBEDDING_DIM)
+        saved = self.conn.execute("SELECT value FROM meta WHERE key = 'hnsw_version'").fetchone()
+        if saved and saved[0] == version and self._ann_path.exists():
+            try:
+                index.load_index(str(self._ann_path), max_elements=n)
+            except RuntimeError:
+                saved = None
+        if not (saved and saved[0] == version):
+            index.init_index(max_elements=n, ef_construction=200, M=16)
+            index.add_items(np.asarray(arr), np.fromiter((row[0] for row in rows), dtype=np.int64))
+            try:
+                index.save_index(str(self._ann_path))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('hnsw_version', ?)",
+                    (version,),
+                )
+                self.conn.commit()
+            except (OSError, RuntimeError):
+                pass  # unsaved index still serves this process
+
+        self._ann = index
+        self._ann_version = version
+        return self._ann
+
+    def _append_ann(self, ann, ids, vectors):
+        """Grow a live HNSW index in place with freshly inserted rows.
+
+        Rebuilding after every write made add-then-search pay a full O(N)
+        index construction; appending new points keeps the graph current at
+        O(log N) each. Runs after _invalidate_cache so the index is stamped
+        with the post-write data version. Callers pass the index reference
+        captured before invalidation; ann is None when no index was built
+        (small store, hnswlib missing, or no search yet), in which case the
+        next search builds it lazily as usual.
+        """
+        if ann is None:
+            return
+        vectors = np.array(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        try:
+            ann.resize_index(ann.get_current_count() + len(vectors))
+            ann.add_items(vectors, np.asarray(list(ids), dtype=np.int64))
+        except RuntimeError:
+            return  # next search falls back to a full rebuild
+        version = self._data_version()
+        self._ann = ann
+        self._ann_version = version
+        try:
+            ann.save_index(str(self._ann_path))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('hnsw_version', ?)",
+                (version,),
+            )
+            self.conn.commit()
+        except (OSError, RuntimeError):
+            pass  # unsaved index still serves this process
+
     def add(self, content: str, tags: Optional[List[str]] = None) -> Memory:
         """Add a new memory."""
         tags = tags or []
@@ -59,9 +332,12 @@ class MemoryStore:
 
         cursor = self.conn.execute(
             "INSERT INTO memories (content, tags, embedding) VALUES (?, ?, ?)",
-            (content, json.dumps(tags), embedding.tobytes()),
+            (content, json.dumps(tags), _encode_embedding(embedding)),
         )
         self.conn.commit()
+        ann = self._ann  # grown in place below instead of rebuilt
+        self._invalidate_cache()
+        self._append_ann(ann, [cursor.lastrowid], [embedding])
 
         return Memory(
             id=cursor.lastrowid,
@@ -78,12 +354,21 @@ class MemoryStore:
 
         rows = []
         for i, (content, tags) in enumerate(items):
-            rows.append((content, json.dumps(tags or []), embeddings[i].tobytes()))
-
-        self.conn.executemany(
-            "INSERT INTO memories (content, tags, embedding) VALUES (?, ?, ?)", rows
-        )
-        self.conn.commit()
+            tags_json = json.dumps(tags) if tags else _EMPTY_TAGS
+            rows.append((content, tags_json, _encode_embedding(embeddings[i])))
+
+        # Single transaction: one fsync for the whole batch instead of one
+        # per autocommitted statement
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO memories (content, tags, embedding) VALUES (?, ?, ?)", rows
+            )
+        # Sequential AUTOINCREMENT inserts in one transaction get contiguous
+        # ids, so the batch is the last len(rows) of them
+        last_id = self.conn.execute("SELECT MAX(id) FROM memories").fetchone()[0]
+        ann = self._ann  # grown in place below instead of rebuilt
+        self._invalidate_cache()
+        self._append_ann(ann, range(last_id - len(rows) + 1, last_id + 1), embeddings)
         return len(rows)
 
     def search(
@@ -92,77 +377,85 @@ class MemoryStore:
         """Search memories semantically."""
         query_embedding = embed_text(query)
 
-        # Fetch all memories (for MVP; could optimize with approximate search later)
-        cursor = self.conn.execute("SELECT id, content, tags, embedding, created_at FROM memories")
-        rows = cursor.fetchall()
+        # Serve candidates from the in-memory cache; only the first search
+        # (or the first after a write) pays the SQL + BLOB-decode phase
+        rows, tag_lists, arr, id_index = self._load_embeddings()
 
         if not rows:
             return []
 
-        # Build arrays
+        # Approximate path: untagged queries with hnswlib installed skip the
+        # full scan and ask the HNSW graph for the top-limit neighbors
+        ann = self._load_ann() if not tags else None
+        if ann is not None:
+            k = min(limit, len(rows))
+            ann.set_ef(max(64, 2 * k))
+            labels, dists = ann.knn_query(query_embedding / np.linalg.norm(query_embedding), k=k)
+            top = np.fromiter((id_index[mid] for mid in labels[0]), dtype=np.intp)
+            scores = np.empty(len(rows), dtype=np.float32)
+            scores[top] = 1.0 - dists[0]  # cosine distance -> similarity
+        else:
+            # Tag filter against the pre-parsed tag lists
+            if tags:
+                tagset = set(tags)
+                idx = [i for i, row_tags in enumerate(tag_lists) if tagset.intersection(row_tags)]
+                if not idx:
+                    return []
+                rows = [rows[i] for i in idx]
+                tag_lists = [tag_lists[i] for i in idx]
+                arr = arr[idx]
+
+            n = len(rows)
+            scores = cosine_similarities(query_embedding, arr)
+
+            # Partial-select the top-limit scores, then sort just those descending
+            if limit < n:
+                top = np.argpartition(scores, -limit)[-limit:]
+            else:
+                top = np.arange(n)
+            top = top[np.argsort(scores[top])[::-1]]
+
+        # Hydrate Memory objects only for the surviving rows
         memories = []
-        embeddings = []
-
-        for row in rows:
-            mem_tags = json.loads(row[2])
-
-            # Filter by tags if specified
-            if tags and not any(t in mem_tags for t in tags):
-                continue
+        for i in top:
+            score = float(scores[i])
+            if score < min_score:
+                break  # descending order: everything after is lower still
 
+            row = rows[i]
             memories.append(
                 Memory(
                     id=row[0],
                     content=row[1],
-                    tags=mem_tags,
+                    tags=list(tag_lists[i]),
                     created_at=datetime.fromisoformat(row[4]),
-                    embedding=np.frombuffer(row[3], dtype=np.float32),
+                    embedding=arr[i].copy(),
+                    score=score,
                 )
             )
-            embeddings.append(np.frombuffer(row[3], dtype=np.float32))
-
-        if not memories:
-            return []
-
-        # Compute similarities
-        embeddings_array = np.vstack(embeddings)
-        scores = cosine_similarities(query_embedding, embeddings_array)
 
-        # Attach scores and sort
-        for i, mem in enumerate(memories):
-            mem.score = float(scores[i])
-
-        memories = [m for m in memories if m.score >= min_score]
-        memories.sort(key=lambda m: m.score, reverse=True)
-
-        return memories[:limit]
+        return memories
 
     def list(self, limit: int = 20, tags: Optional[List[str]] = None) -> List[Memory]:
         """List recent memories."""
-        cursor = self.conn.execute(
-            "SELECT id, content, tags, created_at FROM memories ORDER BY created_at DESC"
-        )
-
-        memories = []
-        for row in cursor:
-            mem_tags = json.loads(row[2])
-
-            if tags and not any(t in mem_tags for t in tags):
-                continue
-
-            memories.append(
-                Memory(
-                    id=row[0],
-                    content=row[1],
-                    tags=mem_tags,
-                    created_at=datetime.fromisoformat(row[3]),
-                )
+        sql = "SELECT id, content, tags, created_at FROM memories"
+        params = []
+        if tags:
+            clause, params = _tag_filter_sql(tags)
+            sql += f" WHERE {clause}"
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        cursor = self.conn.execute(sql, [*params, limit])
+
+        fromiso = datetime.fromisoformat
+        return [
+            Memory(
+                id=row[0],
+                content=row[1],
+                tags=json.loads(row[2]),
+                created_at=fromiso(row[3]),
             )
-
-            if len(memories) >= limit:
-                break
-
-        return memories
+            for row in cursor
+        ]
 
     def get(self, memory_id: int) -> Optional[Memory]:
         """Get a memory by ID."""
@@ -179,7 +472,7 @@ class MemoryStore:
             content=row[1],
             tags=json.loads(row[2]),
             created_at=datetime.fromisoformat(row[4]),
-            embedding=np.frombuffer(row[3], dtype=np.float32) if row[3] else None,
+            embedding=_decode_embedding(row[3]) if row[3] else None,
         )
 
     def update(
@@ -201,7 +494,7 @@ class MemoryStore:
             embedding = embed_text(new_content)
             self.conn.execute(
                 "UPDATE memories SET content = ?, tags = ?, embedding = ? WHERE id = ?",
-                (new_content, json.dumps(new_tags), embedding.tobytes(), memory_id),
+                (new_content, json.dumps(new_tags), _encode_embedding(embedding), memory_id),
             )
         else:
             self.conn.execute(
@@ -210,12 +503,14 @@ class MemoryStore:
             )
 
         self.conn.commit()
+        self._invalidate_cache()
         return self.get(memory_id)
 
     def delete(self, memory_id: int) -> bool:
         """Delete a memory by ID."""
         cursor = self.conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
         self.conn.commit()
+        self._invalidate_cache()
         return cursor.rowcount > 0
 
     def count(self) -> int:
@@ -223,21 +518,40 @@ class MemoryStore:
         cursor = self.conn.execute("SELECT COUNT(*) FROM memories")
         return cursor.fetchone()[0]
 
-    def export_json(self) -> List[dict]:
-        """Export all memories as JSON-serializable dicts."""
+    def export_json(self) -> Iterator[dict]:
+        """Yield all memories as JSON-serializable dicts.
+
+        A generator rather than a list: callers stream rows straight to
+        disk, so exporting a large store never materializes it in memory.
+        """
         cursor = self.conn.execute(
-            "SELECT id, content, tags, created_at FROM memories ORDER BY created_at"
+            "SELECT id, content, tags, created_at FROM memories ORDER BY created_at, id"
         )
-        return [
-            {"id": row[0], "content": row[1], "tags": json.loads(row[2]), "created_at": row[3]}
-            for row in cursor
-        ]
+        for row in cursor:
+            yield {
+                "id": row[0],
+                "content": row[1],
+                "tags": json.loads(row[2]),
+                "created_at": row[3],
+            }
 
     def import_json(self, data: List[dict]) -> int:
         """Import memories from JSON."""
         items = [(d["content"], d.get("tags", [])) for d in data]
         return self.add_batch(items)
 
+    def __enter__(self) -> "MemoryStore":
+        return self
+
+    def __exit__(self, *exc):
+        # Deliberately does not close: the CLI shares one cached store across
+        # sub-commands (REPL mode runs many per process), so the per-command
+        # 'with' blocks only scope usage. The atexit hook in cli.py owns the
+        # actual close().
+        pass
+
     def close(self):
-        """Close database connection."""
-        self.conn.close()
+        """Close database connection (safe to call more than once)."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None